@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+启动速度基准：测量从启动解释器到主窗口首次显示的时间（time-to-first-window）
+
+用法:
+    uv run bench_startup.py [-n 次数] [--eager] [--offscreen]
+
+--eager 在创建窗口前先导入时间调整引擎，用于对比延迟导入带来的差异。
+"""
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+# 子进程中执行：窗口显示后事件循环的第一个回调即输出并退出
+CHILD_CODE = r"""
+import sys
+import time
+start = time.perf_counter()
+if {eager}:
+    import refresh_time
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QApplication
+from main import FolderTimeAdjuster
+
+app = QApplication(sys.argv)
+window = FolderTimeAdjuster()
+window.show()
+
+def ready():
+    print(f"READY {{time.perf_counter() - start:.6f}}", flush=True)
+    app.quit()
+
+QTimer.singleShot(0, ready)
+app.exec()
+"""
+
+def run_once(eager, env):
+    """启动一次子进程，返回 (总耗时, 进程内耗时)，单位秒"""
+    code = CHILD_CODE.format(eager=eager)
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-c", code],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        stdout=subprocess.PIPE,
+        text=True,
+        env=env,
+    )
+    for line in proc.stdout:
+        if line.startswith("READY"):
+            wall = time.perf_counter() - start
+            in_process = float(line.split()[1])
+            break
+    else:
+        proc.wait()
+        raise RuntimeError(f"子进程未能显示窗口（退出码 {proc.returncode}）")
+    proc.wait()
+    return wall, in_process
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="测量主窗口首次显示时间")
+    parser.add_argument("-n", type=int, default=5, help="重复次数（默认 5）")
+    parser.add_argument("--eager", action="store_true", help="启动时立即导入时间调整引擎（对比用）")
+    parser.add_argument("--offscreen", action="store_true", help="使用 offscreen 平台，无需显示器")
+    args = parser.parse_args(argv)
+
+    env = dict(os.environ)
+    if args.offscreen:
+        env["QT_QPA_PLATFORM"] = "offscreen"
+
+    walls = []
+    in_processes = []
+    for _ in range(args.n):
+        wall, in_process = run_once(args.eager, env)
+        walls.append(wall)
+        in_processes.append(in_process)
+
+    print(f"time-to-first-window（{args.n} 次）")
+    print(f"  总耗时   中位数 {statistics.median(walls) * 1000:.1f} ms, 最小 {min(walls) * 1000:.1f} ms")
+    print(f"  进程内   中位数 {statistics.median(in_processes) * 1000:.1f} ms, 最小 {min(in_processes) * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
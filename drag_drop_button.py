@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+import os
+from PySide6.QtWidgets import QPushButton, QSizePolicy
+from PySide6.QtCore import Signal
+from PySide6.QtGui import QFont
+
+class DragDropButton(QPushButton):
+    """支持拖放的自定义按钮组件"""
+    pathChanged = Signal(str, list)  # 信号：传递路径和文件列表
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAcceptDrops(True)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        
+        # 设置按钮样式
+        self.setStyleSheet("""
+            QPushButton {
+                border: 2px dashed #aaa;
+                border-radius: 15px;
+                padding: 25px;
+                font-size: 16px;
+                background-color: #f8f8f8;
+                min-height: 80px;
+                min-width: 250px;
+            }
+            QPushButton:hover {
+                background-color: #e0e0e0;
+            }
+        """)
+        
+        # 设置字体
+        font = QFont()
+        font.setBold(True)
+        self.setFont(font)
+
+    def dragEnterEvent(self, event):
+        """处理拖拽进入事件"""
+        if event.mimeData().hasUrls():
+            event.acceptProposedAction()
+
+    def dropEvent(self, event):
+        """处理拖放事件"""
+        urls = event.mimeData().urls()
+        file_paths = []
+        folder_path = ""
+        
+        for url in urls:
+            if url.isLocalFile():
+                path = url.toLocalFile()
+                if os.path.isfile(path):
+                    file_paths.append(path)
+                elif os.path.isdir(path):
+                    folder_path = path
+        
+        # 发出信号
+        self.pathChanged.emit(folder_path, file_paths)
+        event.acceptProposedAction()
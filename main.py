@@ -2,70 +2,12 @@
 import sys
 import os
 import datetime
-import pytz
-from PySide6.QtWidgets import (
-    QApplication, QWidget, QFileDialog, QMessageBox, QVBoxLayout, 
-    QPushButton, QLabel, QSizePolicy, QLayout
-)
-from PySide6.QtCore import Qt, Signal, QCoreApplication
-from PySide6.QtGui import QFont
-from refresh_time import adjust_directory_times, modifyFileTime, set_directory_times_uniformly  # 导入新函数
-
-# 导入生成的 UI 类
-from ui_main import Ui_Form
+from PySide6.QtWidgets import QApplication, QWidget, QFileDialog, QMessageBox
+from PySide6.QtCore import Qt, QCoreApplication
 
-class DragDropButton(QPushButton):
-    """支持拖放的自定义按钮组件"""
-    pathChanged = Signal(str, list)  # 信号：传递路径和文件列表
-    
-    def __init__(self, text, parent=None):
-        super().__init__(text, parent)
-        self.setAcceptDrops(True)
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        
-        # 设置按钮样式
-        self.setStyleSheet("""
-            QPushButton {
-                border: 2px dashed #aaa;
-                border-radius: 15px;
-                padding: 25px;
-                font-size: 16px;
-                background-color: #f8f8f8;
-                min-height: 80px;
-                min-width: 250px;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-        """)
-        
-        # 设置字体
-        font = QFont()
-        font.setBold(True)
-        self.setFont(font)
-
-    def dragEnterEvent(self, event):
-        """处理拖拽进入事件"""
-        if event.mimeData().hasUrls():
-            event.acceptProposedAction()
-
-    def dropEvent(self, event):
-        """处理拖放事件"""
-        urls = event.mimeData().urls()
-        file_paths = []
-        folder_path = ""
-        
-        for url in urls:
-            if url.isLocalFile():
-                path = url.toLocalFile()
-                if os.path.isfile(path):
-                    file_paths.append(path)
-                elif os.path.isdir(path):
-                    folder_path = path
-        
-        # 发出信号
-        self.pathChanged.emit(folder_path, file_paths)
-        event.acceptProposedAction()
+# 导入生成的 UI 类（拖放按钮已在 UI 中直接创建）
+# 时间调整引擎（依赖 win32file）在首次执行时才导入，以加快启动
+from ui_main import Ui_Form
 
 class FolderTimeAdjuster(QWidget):
     def __init__(self):
@@ -81,24 +23,8 @@ class FolderTimeAdjuster(QWidget):
         # 设置窗口最小大小
         self.setMinimumSize(400, 450)
 
-        # 替换普通按钮为支持拖放的按钮
-        self.drop_button = DragDropButton("拖放文件夹或文件，或点击选择", self)
-        
-        # 获取主布局
-        layout = self.ui.verticalLayout_2
-        
-        # 替换原按钮
-        index = layout.indexOf(self.ui.pushButton_path)
-        if index != -1:
-            # 保存布局参数
-            stretch = layout.stretch(index)
-            
-            # 移除原按钮
-            layout.takeAt(index)
-            self.ui.pushButton_path.deleteLater()
-            
-            # 添加新按钮
-            layout.insertWidget(index, self.drop_button, stretch=stretch)
+        # 支持拖放的按钮
+        self.drop_button = self.ui.pushButton_path
         
         # 连接信号槽
         self.drop_button.clicked.connect(self.select_path)
@@ -108,6 +34,9 @@ class FolderTimeAdjuster(QWidget):
         self.ui.pushButton_enter.clicked.connect(self.adjust_times)
         self.ui.pushButton_enter.setEnabled(False)
         
+        # 设置按报告重试按钮
+        self.ui.pushButton_retry.clicked.connect(self.retry_from_report)
+        
         # 设置时间编辑器
         self.ui.dateTimeEdit_timeinput.setDateTime(datetime.datetime.now())
         self.ui.dateTimeEdit_timeinput.setDisplayFormat("yyyy-MM-dd HH:mm:ss")
@@ -120,6 +49,7 @@ class FolderTimeAdjuster(QWidget):
         # 设置复选框默认状态
         self.ui.checkBox_file_select_change.setChecked(False)  # 默认文件夹模式
         self.ui.checkBox_modelchange.setChecked(False)         # 默认时间差模式
+        self.ui.checkBox_follow_symlinks.setChecked(False)     # 默认不跟随链接，原地修改链接本身
         
         # 连接复选框状态变化信号
         self.ui.checkBox_file_select_change.stateChanged.connect(self.toggle_file_folder_mode)
@@ -257,6 +187,59 @@ class FolderTimeAdjuster(QWidget):
             if folder_path:
                 self.set_folder_path(folder_path)
 
+    def run_retry(self, report_path):
+        """按运行报告只重试失败项目，返回 (成功数, 总数, 本次重试的报告路径)"""
+        from refresh_time import retry_failed
+        from run_report import RunReport, default_report_path
+
+        retry_report_path = default_report_path()
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        QCoreApplication.processEvents()
+        try:
+            with RunReport(retry_report_path) as report:
+                success_count, total_count = retry_failed(report_path, report)
+        finally:
+            QApplication.restoreOverrideCursor()
+        return success_count, total_count, retry_report_path
+
+    def retry_from_report(self):
+        """选择之前保存的运行报告，只重试其中失败的项目"""
+        from run_report import default_report_dir
+
+        report_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "选择运行报告",
+            default_report_dir(),
+            "运行报告 (*.jsonl)"
+        )
+        if not report_path:
+            return
+
+        try:
+            success_count, total_count, retry_report_path = self.run_retry(report_path)
+            self.show_result(success_count, total_count, retry_report_path)
+        except Exception as e:
+            QMessageBox.critical(self, "错误", 
+                f"按报告重试时发生错误:\n{str(e)}")
+
+    def show_result(self, success_count, total_count, report_path):
+        """显示处理结果，有失败项目时提供按报告重试"""
+        while success_count != total_count:
+            reply = QMessageBox.question(self, "部分成功", 
+                f"时间调整完成！\n"
+                f"共处理 {total_count} 个项目，成功 {success_count} 个，失败 {total_count - success_count} 个。\n\n"
+                f"失败项目及错误码已写入报告:\n{report_path}\n\n"
+                "是否只重试失败的项目？",
+                QMessageBox.Yes | QMessageBox.No)
+            if reply != QMessageBox.Yes:
+                return
+
+            success_count, total_count, report_path = self.run_retry(report_path)
+
+        QMessageBox.information(self, "成功", 
+            f"时间调整成功完成！\n"
+            f"共处理 {total_count} 个项目，全部成功。")
+
     def adjust_times(self):
         """执行时间调整操作"""
         # 获取用户选择的时间（如果用户修改过时间）
@@ -277,44 +260,35 @@ class FolderTimeAdjuster(QWidget):
             self.ui.pushButton_enter.setEnabled(False)
             QCoreApplication.processEvents()
 
-            success_count = 0
-            total_count = 0
+            # 首次执行时才加载时间调整引擎
+            from refresh_time import adjust_directory_times, set_files_times, set_directory_times_uniformly
+            from run_report import RunReport, default_report_path
+
+            follow_symlinks = self.ui.checkBox_follow_symlinks.isChecked()
+            report_path = default_report_path()
             
-            if not self.ui.checkBox_file_select_change.isChecked():
-                # 文件夹模式
-                if self.ui.checkBox_modelchange.isChecked():
-                    # 整体修改模式 - 所有内容设置为相同时间
-                    success_count, total_count = set_directory_times_uniformly(self.selected_folder, custom_time)
+            with RunReport(report_path) as report:
+                if not self.ui.checkBox_file_select_change.isChecked():
+                    # 文件夹模式
+                    if self.ui.checkBox_modelchange.isChecked():
+                        # 整体修改模式 - 所有内容设置为相同时间
+                        success_count, total_count = set_directory_times_uniformly(
+                            self.selected_folder, custom_time, follow_symlinks, report)
+                    else:
+                        # 时间差模式 - 保持相对时间差
+                        success_count, total_count = adjust_directory_times(
+                            self.selected_folder, custom_time, follow_symlinks, report)
                 else:
-                    # 时间差模式 - 保持相对时间差
-                    success_count, total_count = adjust_directory_times(self.selected_folder, custom_time)
-            else:
-                # 文件模式 - 总是整体修改
-                total_count = len(self.selected_files)
-                for file_path in self.selected_files:
-                    try:
-                        # 使用modifyFileTime设置文件时间（三个时间都设置为custom_time）
-                        if modifyFileTime(file_path, custom_time, custom_time, custom_time):
-                            success_count += 1
-                        else:
-                            print(f"处理文件 {file_path} 时失败（modifyFileTime返回False）")
-                    except Exception as e:
-                        print(f"处理文件 {file_path} 时出错: {str(e)}")
+                    # 文件模式 - 总是整体修改
+                    success_count, total_count = set_files_times(
+                        self.selected_files, custom_time, follow_symlinks, report)
 
             # 恢复 UI
             QApplication.restoreOverrideCursor()
             self.ui.pushButton_enter.setEnabled(True)
 
-            # 显示结果
-            if success_count == total_count:
-                QMessageBox.information(self, "成功", 
-                    f"时间调整成功完成！\n"
-                    f"共处理 {total_count} 个项目，全部成功。")
-            else:
-                QMessageBox.warning(self, "部分成功", 
-                    f"时间调整完成！\n"
-                    f"共处理 {total_count} 个项目，成功 {success_count} 个，失败 {total_count - success_count} 个。\n\n"
-                    "失败原因可能是文件被占用或权限不足。")
+            # 显示结果（部分失败时可只重试失败项目）
+            self.show_result(success_count, total_count, report_path)
 
             # 更新按钮文本
             if not self.ui.checkBox_file_select_change.isChecked():
@@ -351,10 +325,6 @@ class FolderTimeAdjuster(QWidget):
         self.time_changed = False
 
 if __name__ == "__main__":
-    # 增加递归深度限制
-    import sys
-    sys.setrecursionlimit(10000)
-
     app = QApplication(sys.argv)
 
     # 设置应用样式
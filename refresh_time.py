@@ -1,18 +1,27 @@
 import os
+import stat
 import datetime
 import win32file
 import pywintypes
-import pytz
 import time  # 添加时间模块用于重试
+from run_report import RunReport, load_report, error_code, default_report_path
+
+class DuplicateItemError(Exception):
+    """同一物理对象（硬链接或指向同一目标的链接）已在本次运行中处理过"""
 
 class FileHandleContextManager:
-    def __init__(self, path):
+    def __init__(self, path, follow_symlinks=True, seen=None):
         self.path = path
+        self.follow_symlinks = follow_symlinks
+        self.seen = seen  # 已处理对象的 (卷序列号, 文件索引) 集合，None 表示不去重
         self.handle = None
 
     def __enter__(self):
         # 添加 FILE_FLAG_BACKUP_SEMANTICS 标志以支持目录操作
         flags = win32file.FILE_ATTRIBUTE_NORMAL | win32file.FILE_FLAG_BACKUP_SEMANTICS
+        if not self.follow_symlinks:
+            # 打开链接本身而不是链接目标
+            flags |= win32file.FILE_FLAG_OPEN_REPARSE_POINT
         try:
             self.handle = win32file.CreateFile(
                 self.path,
@@ -23,60 +32,231 @@ class FileHandleContextManager:
                 flags,
                 None
             )
-            return self.handle
         except pywintypes.error as e:
             if e.winerror == 32:  # ERROR_SHARING_VIOLATION
                 print(f"文件被占用: {self.path}")
             raise
+        if self.seen is not None:
+            self._check_duplicate()
+        return self.handle
+
+    def _check_duplicate(self):
+        """
+        从已打开的句柄读取物理标识（不额外打开文件），重复时抛出 DuplicateItemError
+
+        出现任何异常都会先关闭句柄（__enter__ 抛出异常时 __exit__ 不会执行，
+        而句柄以独占方式打开，不关闭会一直锁住文件）
+        """
+        try:
+            info = win32file.GetFileInformationByHandle(self.handle)
+            # (属性, 创建时间, 访问时间, 修改时间, 卷序列号, 大小高位, 大小低位, 链接数, 索引高位, 索引低位)
+            key = (info[4], info[8], info[9])
+            if key in self.seen:
+                raise DuplicateItemError(self.path)
+        except BaseException:
+            self.handle.close()
+            self.handle = None
+            raise
+        self.seen.add(key)
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.handle:
             self.handle.close()
 
-def modifyFileTime(file_path, new_creation_time, new_access_time, new_modification_time):
-    """修改单个文件/目录的时间属性（带重试机制）"""
-    retries = 3
+def _is_link(entry):
+    """判断目录项是否为符号链接或目录联接（junction）"""
+    if entry.is_symlink():
+        return True
+    if os.name != "nt":
+        return False
+    # Windows 上 lstat 结果由目录枚举缓存，不需要额外打开文件
+    reparse_tag = getattr(entry.stat(follow_symlinks=False), "st_reparse_tag", 0)
+    return reparse_tag == getattr(stat, "IO_REPARSE_TAG_MOUNT_POINT", None)
+
+def _is_within(path, root):
+    """判断 path 是否位于 root 目录内（两者均为已解析的真实路径）"""
+    path = os.path.normcase(path)
+    root = os.path.normcase(root)
+    try:
+        return os.path.commonpath([path, root]) == root
+    except ValueError:
+        # 不同驱动器
+        return False
+
+def _file_id(path):
+    """获取目录的物理标识 (设备号, 文件号)，用于识别链接循环"""
+    st = os.stat(path)
+    return st.st_dev, st.st_ino
+
+def walk_unique(path, topdown=True, follow_symlinks=True, onerror=None):
+    """
+    类似 os.walk 的目录遍历，但每个目录只进入一次
+
+    跟随链接时按 (设备号, 文件号) 对目录去重，指向已访问目录的链接
+    （包括 junction 循环）会被跳过；只有目录需要额外 stat，普通文件不产生额外 I/O。
+    指向根目录之外的目录链接不会被进入，避免修改所选文件夹以外的文件。
+    硬链接文件的去重在打开句柄时完成（见 FileHandleContextManager 的 seen 参数）。
+    使用显式栈而非递归，深层目录不受递归深度限制。
+
+    参数:
+    path (str): 根目录
+    topdown (bool): True 为先序遍历，False 为后序遍历（先子项后父目录）
+    follow_symlinks (bool): True 时进入链接指向的目录；
+        False 时不进入链接，链接本身作为普通项目放入 files 列表，以便原地修改
+    onerror (callable): 目录无法列出时以 OSError 调用（与 os.walk 相同），默认仅打印
+
+    生成:
+    (root, dirs, files)：dirs 只包含将被进入的子目录，其余项目都在 files 中
+    """
+    def handle_error(e):
+        if onerror is not None:
+            onerror(e)
+        else:
+            print(f"无法读取目录 {e.filename}: {e}")
+
+    # 不跟随链接时目录不会重复也不会成环，无需记录
+    visited = None
+    real_root = None
+    if follow_symlinks:
+        try:
+            visited = {_file_id(path)}
+        except OSError as e:
+            # 根目录已不存在或无法访问（例如重试时目录已被删除）
+            handle_error(e)
+            return
+        real_root = os.path.realpath(path)
+    stack = [(path, False)]
+    pending = {}
+
+    while stack:
+        top, expanded = stack.pop()
+        if expanded:
+            yield pending.pop(top)
+            continue
+
+        try:
+            with os.scandir(top) as it:
+                entries = list(it)
+        except OSError as e:
+            handle_error(e)
+            continue
+
+        # 先处理真实目录项再处理链接，使同一对象优先以真实路径出现
+        links = []
+        for entry in entries:
+            try:
+                links.append(_is_link(entry))
+            except OSError:
+                links.append(True)
+
+        dirs = []
+        files = []
+        for is_link, entry in sorted(zip(links, entries), key=lambda item: item[0]):
+            follow = follow_symlinks or not is_link
+            try:
+                is_dir = entry.is_dir(follow_symlinks=follow)
+            except OSError:
+                is_dir = False
+
+            if not (is_dir and follow):
+                files.append(entry.name)
+                continue
+
+            if visited is not None:
+                if is_link and not _is_within(os.path.realpath(entry.path), real_root):
+                    print(f"跳过指向所选文件夹之外的链接: {entry.path}")
+                    continue
+                try:
+                    key = _file_id(entry.path)
+                except OSError as e:
+                    # 失效链接等无法解析目标的项目，按链接本身处理
+                    print(f"无法读取 {entry.path}: {e}")
+                    files.append(entry.name)
+                    continue
+                if key in visited:
+                    print(f"跳过重复或循环链接的目录: {entry.path}")
+                    continue
+                visited.add(key)
+            dirs.append(entry.name)
+
+        if topdown:
+            yield top, dirs, files
+        else:
+            pending[top] = (top, dirs, files)
+            stack.append((top, True))
+        for d in reversed(dirs):
+            stack.append((os.path.join(top, d), False))
+
+def modifyFileTime(file_path, new_creation_time, new_access_time, new_modification_time,
+                   follow_symlinks=True, report=None, retries=3, seen=None):
+    """
+    修改单个文件/目录的时间属性（带重试机制，失败时写入运行报告）
+
+    传入 seen 时，若该物理对象已处理过则抛出 DuplicateItemError
+    """
     delay = 1  # 重试间隔（秒）
+    start = time.perf_counter()
+    attempts = []
     
     for attempt in range(retries):
         try:
-            with FileHandleContextManager(file_path) as handle:
+            with FileHandleContextManager(file_path, follow_symlinks, seen) as handle:
+                seen = None  # 已完成去重检查，重试时不再检查
                 # 将Python的datetime对象转换为pywintypes的时间对象
                 times = map(pywintypes.Time, [new_creation_time, new_access_time, new_modification_time])
                 new_creation_time, new_access_time, new_modification_time = times
                 # 设置文件/目录时间
                 win32file.SetFileTime(handle, new_creation_time, new_access_time, new_modification_time)
             return True
+        except DuplicateItemError:
+            raise
         except Exception as e:
+            attempts.append({
+                "attempt": attempt + 1,
+                "error_code": error_code(e),
+                "error": str(e),
+                "elapsed": time.perf_counter() - start,
+            })
             if attempt < retries - 1:
                 print(f"重试 {attempt+1}/{retries} - {file_path}")
                 time.sleep(delay)  # 等待后重试
             else:
                 print(f"更新 {file_path} 时间时发生错误: {e}")
+                if report:
+                    report.add_failure(file_path, "write", e, attempts, time.perf_counter() - start)
                 return False
     return False
 
-def get_file_times(path):
-    """获取文件/目录的时间属性（创建时间、访问时间、修改时间）"""
+def get_file_times(path, follow_symlinks=True, report=None, seen=None):
+    """
+    获取文件/目录的时间属性（创建时间、访问时间、修改时间）
+
+    传入 seen 时，若该物理对象已处理过则抛出 DuplicateItemError
+    """
+    start = time.perf_counter()
     try:
-        with FileHandleContextManager(path) as handle:
+        with FileHandleContextManager(path, follow_symlinks, seen) as handle:
             create_time, access_time, modify_time = win32file.GetFileTime(handle)
             # 转换为datetime对象并添加UTC时区信息
-            create_dt = pywintypes.Time(create_time).replace(tzinfo=pytz.UTC)
-            access_dt = pywintypes.Time(access_time).replace(tzinfo=pytz.UTC)
-            modify_dt = pywintypes.Time(modify_time).replace(tzinfo=pytz.UTC)
+            create_dt = pywintypes.Time(create_time).replace(tzinfo=datetime.timezone.utc)
+            access_dt = pywintypes.Time(access_time).replace(tzinfo=datetime.timezone.utc)
+            modify_dt = pywintypes.Time(modify_time).replace(tzinfo=datetime.timezone.utc)
             return create_dt, access_dt, modify_dt
+    except DuplicateItemError:
+        raise
     except Exception as e:
         print(f"读取 {path} 时间时发生错误: {e}")
+        if report:
+            report.add_failure(path, "read", e, elapsed=time.perf_counter() - start)
         return None, None, None
 
-def find_earliest_time(path):
+def find_earliest_time(path, follow_symlinks=True):
     """递归查找文件夹及其所有子项中的最早时间"""
     earliest_time = None
     
     if os.path.isfile(path):
         # 单个文件
-        create_time, access_time, modify_time = get_file_times(path)
+        create_time, access_time, modify_time = get_file_times(path, follow_symlinks)
         if create_time and access_time and modify_time:
             file_min = min(create_time, access_time, modify_time)
             if earliest_time is None or file_min < earliest_time:
@@ -84,18 +264,18 @@ def find_earliest_time(path):
         return earliest_time
     
     # 遍历目录
-    for root, dirs, files in os.walk(path):
+    for root, dirs, files in walk_unique(path, follow_symlinks=follow_symlinks):
         # 处理当前目录
-        create_time, access_time, modify_time = get_file_times(root)
+        create_time, access_time, modify_time = get_file_times(root, follow_symlinks)
         if create_time and access_time and modify_time:
             dir_min = min(create_time, access_time, modify_time)
             if earliest_time is None or dir_min < earliest_time:
                 earliest_time = dir_min
         
-        # 处理文件
+        # 处理文件（不跟随链接时也包括链接本身）
         for file in files:
             file_path = os.path.join(root, file)
-            create_time, access_time, modify_time = get_file_times(file_path)
+            create_time, access_time, modify_time = get_file_times(file_path, follow_symlinks)
             if create_time and access_time and modify_time:
                 file_min = min(create_time, access_time, modify_time)
                 if earliest_time is None or file_min < earliest_time:
@@ -103,19 +283,87 @@ def find_earliest_time(path):
     
     return earliest_time
 
-def adjust_directory_times(path, custom=None):
+def shift_item_time(item_path, time_diff, current_time, follow_symlinks=True, report=None, seen=None):
+    """
+    将单个项目的三个时间整体平移 time_diff（不超过 current_time）
+
+    传入 seen 时，若该物理对象已处理过则抛出 DuplicateItemError
+
+    返回:
+    bool: 是否成功
+    """
+    create_time, access_time, modify_time = get_file_times(item_path, follow_symlinks, report, seen)
+    if create_time and access_time and modify_time:
+        # 确保所有时间都是时区感知的
+        if create_time.tzinfo is None:
+            create_time = create_time.replace(tzinfo=datetime.timezone.utc)
+        if access_time.tzinfo is None:
+            access_time = access_time.replace(tzinfo=datetime.timezone.utc)
+        if modify_time.tzinfo is None:
+            modify_time = modify_time.replace(tzinfo=datetime.timezone.utc)
+        
+        new_create = create_time + time_diff
+        new_access = access_time + time_diff
+        new_modify = modify_time + time_diff
+        
+        # 确保不超过当前时间
+        new_create = min(new_create, current_time)
+        new_access = min(new_access, current_time)
+        new_modify = min(new_modify, current_time)
+        
+        return modifyFileTime(item_path, new_create, new_access, new_modify, follow_symlinks, report)
+    return False
+
+def _apply_to_tree(path, apply_item, follow_symlinks=True, report=None, include_root=True):
+    """
+    后序遍历目录，对每个文件和目录调用 apply_item
+    
+    apply_item 返回 True/False 表示成功/失败，返回 None 表示已处理过的物理对象（不计数）。
+    无法列出内容的目录按一个失败项目计数，并以 stage "list" 写入运行报告，重试时会重新处理整个子树。
+    
+    返回:
+    (success_count, total_count)
+    """
+    success_count = 0
+    total_count = 0
+    
+    def on_list_error(e):
+        nonlocal total_count
+        total_count += 1
+        print(f"无法读取目录 {e.filename}: {e}")
+        if report:
+            report.add_failure(e.filename, "list", e)
+    
+    for root, dirs, files in walk_unique(path, topdown=False, follow_symlinks=follow_symlinks, onerror=on_list_error):
+        # 先处理文件，再处理当前目录（子目录已作为各自的 root 处理过）
+        items = [os.path.join(root, file) for file in files]
+        if include_root or root != path:
+            items.append(root)
+        for item_path in items:
+            result = apply_item(item_path)
+            if result is None:
+                continue
+            total_count += 1
+            if result:
+                success_count += 1
+    
+    return success_count, total_count
+
+def adjust_directory_times(path, custom=None, follow_symlinks=True, report=None):
     """
     调整文件夹及其所有子项的时间，保持时间差结构
     
     参数:
     path (str): 目标路径
     custom (datetime): 目标基准时间（如果不提供则使用当前时间）
+    follow_symlinks (bool): 是否跟随符号链接/目录联接，False 时原地修改链接本身
+    report (RunReport): 运行报告，记录失败项目和汇总（可选）
     """
     if not os.path.exists(path):
         raise FileNotFoundError(f"路径不存在: {path}")
     
     # 1. 找到最早的时间
-    earliest_time = find_earliest_time(path)
+    earliest_time = find_earliest_time(path, follow_symlinks)
     if earliest_time is None:
         raise RuntimeError(f"无法获取 {path} 的时间信息")
     
@@ -133,7 +381,7 @@ def adjust_directory_times(path, custom=None):
     
     # 确保最早时间也是时区感知的（使用UTC时区）
     if earliest_time.tzinfo is None:
-        earliest_time = earliest_time.replace(tzinfo=pytz.UTC)
+        earliest_time = earliest_time.replace(tzinfo=datetime.timezone.utc)
     
     # 3. 计算时间差
     time_diff = custom - earliest_time
@@ -152,121 +400,258 @@ def adjust_directory_times(path, custom=None):
     print(f"目标时间: {custom}")
     print(f"时间差: {time_diff}")
     
+    if report:
+        report.begin(
+            "adjust",
+            path=path,
+            custom_time=custom.isoformat(),
+            earliest_time=earliest_time.isoformat(),
+            time_diff=time_diff.total_seconds(),
+            follow_symlinks=follow_symlinks,
+        )
+    
     # 5. 递归修改时间
-    def adjust_item(item_path):
-        """调整单个项目的时间"""
-        create_time, access_time, modify_time = get_file_times(item_path)
-        if create_time and access_time and modify_time:
-            # 确保所有时间都是时区感知的
-            if create_time.tzinfo is None:
-                create_time = create_time.replace(tzinfo=pytz.UTC)
-            if access_time.tzinfo is None:
-                access_time = access_time.replace(tzinfo=pytz.UTC)
-            if modify_time.tzinfo is None:
-                modify_time = modify_time.replace(tzinfo=pytz.UTC)
-            
-            new_create = create_time + time_diff
-            new_access = access_time + time_diff
-            new_modify = modify_time + time_diff
-            
-            # 确保不超过当前时间
-            new_create = min(new_create, current_time)
-            new_access = min(new_access, current_time)
-            new_modify = min(new_modify, current_time)
-            
-            return modifyFileTime(item_path, new_create, new_access, new_modify)
-        return False
+    seen = set()  # 已处理的物理对象，硬链接只调整一次
     
-    total_count = 0
-    success_count = 0
+    def adjust_item(item_path):
+        """调整单个项目的时间，已处理过的物理对象返回 None"""
+        try:
+            return shift_item_time(item_path, time_diff, current_time, follow_symlinks, report, seen)
+        except DuplicateItemError:
+            return None
+        except Exception as e:
+            print(f"处理 {item_path} 时出错: {e}")
+            if report:
+                report.add_failure(item_path, "process", e)
+            return False
     
     if os.path.isfile(path):
         # 单个文件
         total_count = 1
-        if adjust_item(path):
-            success_count = 1
+        success_count = 1 if adjust_item(path) else 0
     else:
-        # 遍历目录
-        for root, dirs, files in os.walk(path, topdown=False):
-            # 先处理文件
-            for file in files:
-                file_path = os.path.join(root, file)
-                total_count += 1
-                try:
-                    if adjust_item(file_path):
-                        success_count += 1
-                except Exception as e:
-                    print(f"处理文件 {file_path} 时出错: {e}")
-            
-            # 处理目录（包括当前目录）
-            dirs_to_adjust = [root] + [os.path.join(root, d) for d in dirs]
-            for dir_path in dirs_to_adjust:
-                total_count += 1
-                try:
-                    if adjust_item(dir_path):
-                        success_count += 1
-                except Exception as e:
-                    print(f"处理目录 {dir_path} 时出错: {e}")
+        # 遍历目录（后序遍历，每个物理对象只处理一次）
+        success_count, total_count = _apply_to_tree(path, adjust_item, follow_symlinks, report)
     
     if total_count > 0:
         print(f"已完成时间调整: {success_count}/{total_count} 个项目成功")
     else:
         print("没有找到可调整的项目")
     
+    if report:
+        report.summarize(success_count, total_count)
+    return success_count, total_count
+
+def set_files_times(file_paths, custom_time, follow_symlinks=True, report=None):
+    """
+    将多个文件/目录的时间统一设置为指定时间（不递归）
+    
+    参数:
+    file_paths (list): 项目路径列表
+    custom_time (datetime): 目标时间
+    follow_symlinks (bool): 是否跟随符号链接，False 时原地修改链接本身
+    report (RunReport): 运行报告，记录失败项目和汇总（可选）
+    """
+    if report:
+        report.begin("files", custom_time=custom_time.isoformat(), follow_symlinks=follow_symlinks)
+    
+    total_count = 0
+    success_count = 0
+    seen = set()  # 已处理的物理对象，同一文件的多个硬链接只设置一次
+    for file_path in file_paths:
+        try:
+            # 三个时间都设置为custom_time
+            result = modifyFileTime(file_path, custom_time, custom_time, custom_time, follow_symlinks, report, seen=seen)
+            total_count += 1
+            if result:
+                success_count += 1
+            else:
+                print(f"处理文件 {file_path} 时失败（modifyFileTime返回False）")
+        except DuplicateItemError:
+            continue
+        except Exception as e:
+            total_count += 1
+            print(f"处理文件 {file_path} 时出错: {str(e)}")
+            if report:
+                report.add_failure(file_path, "process", e)
+    
+    if report:
+        report.summarize(success_count, total_count)
     return success_count, total_count
 
-def set_directory_times_uniformly(path, custom_time):
+def set_directory_times_uniformly(path, custom_time, follow_symlinks=True, report=None):
     """
     将文件夹及其所有子项的时间统一设置为指定时间（带根目录重试机制）
     
     参数:
     path (str): 目标路径
     custom_time (datetime): 目标时间
+    follow_symlinks (bool): 是否跟随符号链接/目录联接，False 时原地修改链接本身
+    report (RunReport): 运行报告，记录失败项目和汇总（可选）
     """
     if not os.path.exists(path):
         raise FileNotFoundError(f"路径不存在: {path}")
     
-    total_count = 0
-    success_count = 0
-    failed_items = []
+    if report:
+        report.begin("uniform", path=path, custom_time=custom_time.isoformat(), follow_symlinks=follow_symlinks)
     
-    def set_item_time(item_path):
-        """设置单个项目的时间"""
-        nonlocal total_count, success_count, failed_items
-        total_count += 1
+    seen = set()  # 已处理的物理对象，硬链接只设置一次
+    
+    def set_item_time(item_path, retries=3):
+        """设置单个项目的时间，已处理过的物理对象返回 None"""
         try:
-            if modifyFileTime(item_path, custom_time, custom_time, custom_time):
-                success_count += 1
-                return True
-            else:
-                failed_items.append(item_path)
-                return False
+            return modifyFileTime(item_path, custom_time, custom_time, custom_time,
+                                  follow_symlinks, report, retries, seen)
+        except DuplicateItemError:
+            return None
         except Exception as e:
             print(f"设置 {item_path} 时间时出错: {str(e)}")
-            failed_items.append(item_path)
+            if report:
+                report.add_failure(item_path, "process", e)
             return False
     
-    # 首先处理所有子项
+    # 首先处理所有子项（后序遍历，每个物理对象只处理一次）
+    success_count = 0
+    total_count = 0
     if os.path.isdir(path):
-        # 遍历目录（先处理子项）
-        for root, dirs, files in os.walk(path):
-            # 处理文件
-            for file in files:
-                file_path = os.path.join(root, file)
-                set_item_time(file_path)
-            
-            # 处理子目录（不包括根目录）
-            for dir_name in dirs:
-                dir_path = os.path.join(root, dir_name)
-                set_item_time(dir_path)
-    
-    # 最后处理根目录（尝试多次）
-    root_retries = 3
-    for attempt in range(root_retries):
-        if set_item_time(path):
-            break
-        elif attempt < root_retries - 1:
-            print(f"重试根目录 {attempt+1}/{root_retries}")
-            time.sleep(1)
-    
-    return success_count, total_count
\ No newline at end of file
+        success_count, total_count = _apply_to_tree(
+            path, set_item_time, follow_symlinks, report, include_root=False)
+    
+    # 最后处理根目录（尝试更多次，重试历史合并为一条记录）
+    root_retries = 9
+    total_count += 1
+    if set_item_time(path, retries=root_retries):
+        success_count += 1
+    
+    if report:
+        report.summarize(success_count, total_count)
+    return success_count, total_count
+
+def retry_failed(report_path, report=None):
+    """
+    只重新处理运行报告中失败的项目，沿用原运行的模式和参数
+    
+    参数:
+    report_path (str): 之前生成的运行报告路径
+    report (RunReport): 本次重试的运行报告（可选）
+    
+    返回:
+    (success_count, total_count)
+    """
+    run, failures = load_report(report_path)
+    if run is None:
+        raise ValueError(f"报告中没有运行参数记录: {report_path}")
+    
+    mode = run["mode"]
+    follow_symlinks = run.get("follow_symlinks", True)
+    custom_time = datetime.datetime.fromisoformat(run["custom_time"])
+    seen = set()  # 已处理的物理对象
+    print(f"重试 {len(failures)} 个失败项目（模式: {mode}）")
+    
+    if mode in ("uniform", "files"):
+        if report:
+            report.begin(mode, retry_of=report_path, custom_time=run["custom_time"],
+                         follow_symlinks=follow_symlinks)
+        
+        def retry_item(item_path):
+            try:
+                return modifyFileTime(item_path, custom_time, custom_time, custom_time,
+                                      follow_symlinks, report, seen=seen)
+            except DuplicateItemError:
+                return None
+    elif mode == "adjust":
+        time_diff = datetime.timedelta(seconds=run["time_diff"])
+        if report:
+            # 保留原运行的参数，使重试报告可以再次重试
+            params = {k: v for k, v in run.items() if k not in ("type", "mode", "started_at", "retry_of")}
+            report.begin(mode, retry_of=report_path, **params)
+        current_time = datetime.datetime.now().astimezone()
+        
+        def retry_item(item_path):
+            try:
+                return shift_item_time(item_path, time_diff, current_time, follow_symlinks, report, seen)
+            except DuplicateItemError:
+                return None
+            except Exception as e:
+                print(f"处理 {item_path} 时出错: {e}")
+                if report:
+                    report.add_failure(item_path, "process", e)
+                return False
+    else:
+        raise ValueError(f"未知的运行模式: {mode}")
+    
+    success_count = 0
+    total_count = 0
+    for item_path, stage in failures:
+        if stage == "list":
+            # 之前无法列出内容的目录，重新处理整个子树
+            tree_success, tree_total = _apply_to_tree(item_path, retry_item, follow_symlinks, report)
+            success_count += tree_success
+            total_count += tree_total
+            continue
+        result = retry_item(item_path)
+        if result is None:
+            continue
+        total_count += 1
+        if result:
+            success_count += 1
+    
+    print(f"重试完成: {success_count}/{total_count} 个项目成功")
+    if report:
+        report.summarize(success_count, total_count)
+    return success_count, total_count
+
+def main(argv=None):
+    """命令行入口"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="刷新文件夹/文件时间")
+    parser.add_argument("path", nargs="?", help="目标文件夹或文件")
+    parser.add_argument("--time", help="目标时间，格式如 2024-01-01 12:00:00（默认当前时间）")
+    parser.add_argument("--uniform", action="store_true", help="整体模式：所有项目设置为相同时间")
+    parser.add_argument("--follow-symlinks", action="store_true",
+                        help="跟随链接（只进入指向所选文件夹内部的目录链接）；默认不跟随，原地修改链接本身")
+    parser.add_argument("--retry", metavar="REPORT", help="只重新处理该运行报告中失败的项目")
+    parser.add_argument("--report", help="运行报告（JSONL）输出路径")
+    args = parser.parse_args(argv)
+    
+    # 先校验参数，避免出错时留下空的运行报告
+    if args.retry:
+        if args.path:
+            parser.error("--retry 不能与目标路径同时使用")
+        if not os.path.isfile(args.retry):
+            parser.error(f"运行报告不存在: {args.retry}")
+    elif not args.path:
+        parser.error("需要指定目标路径或 --retry")
+    elif not os.path.exists(args.path):
+        parser.error(f"路径不存在: {args.path}")
+    
+    custom_time = None
+    if args.time:
+        try:
+            custom_time = datetime.datetime.fromisoformat(args.time)
+        except ValueError:
+            parser.error(f"无法解析时间: {args.time}（格式如 2024-01-01 12:00:00）")
+    
+    report_path = args.report or default_report_path()
+    with RunReport(report_path) as report:
+        if args.retry:
+            success_count, total_count = retry_failed(args.retry, report)
+        else:
+            follow_symlinks = args.follow_symlinks
+            if args.uniform:
+                custom_time = custom_time or datetime.datetime.now()
+                if custom_time.tzinfo is None:
+                    custom_time = custom_time.astimezone()
+                success_count, total_count = set_directory_times_uniformly(
+                    args.path, custom_time, follow_symlinks, report)
+            else:
+                success_count, total_count = adjust_directory_times(
+                    args.path, custom_time, follow_symlinks, report)
+    
+    print(f"运行报告: {report_path}")
+    return 0 if success_count == total_count else 1
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
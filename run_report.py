@@ -0,0 +1,181 @@
+import os
+import json
+import time
+import queue
+import datetime
+import threading
+
+
+def default_report_dir():
+    """默认的报告目录（用户目录下的 filetime_refresh_reports 文件夹）"""
+    return os.path.join(os.path.expanduser("~"), "filetime_refresh_reports")
+
+def default_report_path():
+    """生成默认的报告文件路径"""
+    stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+    return os.path.join(default_report_dir(), f"run-{stamp}.jsonl")
+
+def error_code(error):
+    """从异常中提取错误码（优先使用 Windows 错误码）"""
+    if error is None:
+        return None
+    code = getattr(error, "winerror", None)
+    if code is None:
+        code = getattr(error, "errno", None)
+    return code
+
+class RunReport:
+    """
+    运行报告（JSONL 格式），由后台线程缓冲写入磁盘
+
+    每行一条记录，type 字段区分:
+    - run: 运行参数（模式、路径、时间差等），用于重试失败项目
+    - failure: 单个失败项目，包含错误码、重试历史和耗时
+    - summary: 最终汇总
+    """
+
+    _STOP = object()
+
+    def __init__(self, path, buffer_size=1024 * 1024):
+        self.path = path
+        self.failed_count = 0
+        self._error = None  # 后台线程遇到的第一个写入错误，在 close() 时抛出
+        self._start = time.perf_counter()
+        self._queue = queue.Queue()
+
+        report_dir = os.path.dirname(os.path.abspath(path))
+        os.makedirs(report_dir, exist_ok=True)
+        self._file = open(path, "w", encoding="utf-8", buffering=buffer_size)
+        self._thread = threading.Thread(target=self._writer, name="RunReportWriter", daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # 已有异常时不再用写入错误覆盖它
+        self.close(raise_error=exc_type is None)
+
+    def _writer(self):
+        """
+        后台写入线程：批量取出记录写入，队列空闲时才刷新到磁盘
+
+        单条记录出错不会中断线程，后续记录照常写入；文件总会被关闭
+        """
+        try:
+            while True:
+                record = self._queue.get()
+                if record is self._STOP:
+                    break
+                try:
+                    # 无法直接序列化的值（如 datetime）转为字符串
+                    self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                    if self._queue.empty():
+                        self._file.flush()
+                except Exception as e:
+                    print(f"写入运行报告 {self.path} 时发生错误: {e}")
+                    if self._error is None:
+                        self._error = e
+        finally:
+            try:
+                self._file.close()
+            except Exception as e:
+                if self._error is None:
+                    self._error = e
+
+    def elapsed(self):
+        """自报告创建以来经过的秒数"""
+        return time.perf_counter() - self._start
+
+    def write(self, record):
+        """提交一条记录（不阻塞调用方）"""
+        self._queue.put(record)
+
+    def begin(self, mode, **params):
+        """写入运行参数记录"""
+        record = {
+            "type": "run",
+            "mode": mode,
+            "started_at": datetime.datetime.now().astimezone().isoformat(),
+        }
+        record.update(params)
+        self.write(record)
+
+    def add_failure(self, path, stage, error=None, attempts=None, elapsed=None):
+        """
+        记录一个失败项目
+
+        参数:
+        path (str): 项目路径
+        stage (str): 失败阶段（list 无法列出目录内容 / read 读取时间 / write 写入时间 / process 其他处理）
+        error (Exception): 最后一次的异常
+        attempts (list): 每次尝试的记录（次数、错误码、错误信息、耗时）
+        elapsed (float): 该项目总耗时（秒）
+        """
+        self.failed_count += 1
+        self.write({
+            "type": "failure",
+            "path": path,
+            "stage": stage,
+            "error_code": error_code(error),
+            "error": str(error) if error is not None else None,
+            "attempts": attempts or [],
+            "elapsed": elapsed,
+        })
+
+    def summarize(self, success_count, total_count):
+        """写入最终汇总记录"""
+        self.write({
+            "type": "summary",
+            "success_count": success_count,
+            "total_count": total_count,
+            "failed_count": self.failed_count,
+            "elapsed": self.elapsed(),
+            "finished_at": datetime.datetime.now().astimezone().isoformat(),
+        })
+
+    def close(self, raise_error=True):
+        """
+        等待后台线程写完所有记录并关闭文件
+
+        参数:
+        raise_error (bool): 后台线程写入出错时是否抛出该错误
+        """
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+        if raise_error and self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+def load_report(path):
+    """
+    读取运行报告
+
+    运行被中断时最后一行可能不完整，无法解析的行会被跳过并提示，其余记录照常读取
+
+    返回:
+    (run, failures): run 为运行参数记录（可能为 None），
+    failures 为按路径去重的 (路径, 失败阶段) 列表
+    """
+    run = None
+    failures = []
+    seen = set()
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"跳过运行报告 {path} 第 {line_number} 行（内容不完整或已损坏）: {e}")
+                continue
+            if not isinstance(record, dict):
+                continue
+            if record.get("type") == "run":
+                run = record
+            elif record.get("type") == "failure" and record.get("path") and record["path"] not in seen:
+                seen.add(record["path"])
+                failures.append((record["path"], record.get("stage")))
+    return run, failures
@@ -1,12 +1,8 @@
-from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
-    QMetaObject, QObject, QPoint, QRect,
-    QSize, QTime, QUrl, Qt)
-from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
-    QFont, QFontDatabase, QGradient, QIcon,
-    QImage, QKeySequence, QLinearGradient, QPainter,
-    QPalette, QPixmap, QRadialGradient, QTransform)
-from PySide6.QtWidgets import (QApplication, QCheckBox, QDateTimeEdit, QHBoxLayout,
-    QPushButton, QSizePolicy, QVBoxLayout, QWidget, QLayout)
+from PySide6.QtCore import (QCoreApplication, QMetaObject, QSize)
+from PySide6.QtWidgets import (QCheckBox, QDateTimeEdit, QHBoxLayout,
+    QPushButton, QSizePolicy, QVBoxLayout, QWidget)
+
+from drag_drop_button import DragDropButton
 
 class Ui_Form(object):
     def setupUi(self, Form):
@@ -20,9 +16,8 @@ class Ui_Form(object):
         self.verticalLayout_2.setContentsMargins(10, 10, 10, 10)
         
         # 拖放按钮区域
-        self.pushButton_path = QPushButton(Form)
+        self.pushButton_path = DragDropButton(Form)
         self.pushButton_path.setObjectName(u"pushButton_path")
-        self.pushButton_path.setMinimumSize(QSize(0, 250))  # 设置最小高度
         self.pushButton_path.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.verticalLayout_2.addWidget(self.pushButton_path)
         
@@ -41,6 +36,10 @@ class Ui_Form(object):
         self.checkBox_file_select_change.setObjectName(u"checkBox_file_select_change")
         self.horizontalLayout.addWidget(self.checkBox_file_select_change)
         
+        self.checkBox_follow_symlinks = QCheckBox(self.horizontalLayoutWidget)
+        self.checkBox_follow_symlinks.setObjectName(u"checkBox_follow_symlinks")
+        self.horizontalLayout.addWidget(self.checkBox_follow_symlinks)
+        
         self.verticalLayout_2.addWidget(self.horizontalLayoutWidget)
         
         # 时间和执行按钮区域
@@ -60,6 +59,11 @@ class Ui_Form(object):
         self.pushButton_enter.setMaximumSize(QSize(16777215, 50))
         self.verticalLayout.addWidget(self.pushButton_enter)
         
+        self.pushButton_retry = QPushButton(self.verticalLayoutWidget)
+        self.pushButton_retry.setObjectName(u"pushButton_retry")
+        self.pushButton_retry.setMaximumSize(QSize(16777215, 50))
+        self.verticalLayout.addWidget(self.pushButton_retry)
+        
         self.verticalLayout_2.addWidget(self.verticalLayoutWidget)
         
         # 添加伸缩因子，使内容均匀分布
@@ -76,5 +80,7 @@ class Ui_Form(object):
         self.pushButton_path.setText(QCoreApplication.translate("Form", u"\u70b9\u51fb\u6765\u9009\u62e9\u8def\u5f84\u6216\u5c06\u6587\u4ef6\u62d6\u5165\u6b64\u5904", None))
         self.checkBox_modelchange.setText(QCoreApplication.translate("Form", u"\u65f6\u95f4\u5dee-\u6574\u4f53", None))
         self.checkBox_file_select_change.setText(QCoreApplication.translate("Form", u"\u6587\u4ef6\u5939-\u6587\u4ef6\u6a21\u5f0f", None))
+        self.checkBox_follow_symlinks.setText(QCoreApplication.translate("Form", u"\u8ddf\u968f\u94fe\u63a5", None))
         self.pushButton_enter.setText(QCoreApplication.translate("Form", u"\u6267\u884c\u65f6\u95f4\u504f\u79fb", None))
+        self.pushButton_retry.setText(QCoreApplication.translate("Form", u"\u4ece\u62a5\u544a\u91cd\u8bd5\u5931\u8d25\u9879\u76ee", None))
     # retranslateUi
\ No newline at end of file